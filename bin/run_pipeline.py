@@ -36,6 +36,7 @@ TELEMATICS_CSV = os.path.join(DATA_DIR, "simulated_telematics.csv")
 FEATURES_CSV = os.path.join(DATA_DIR, "features.csv")
 SCORED_FEATURES_CSV = os.path.join(DATA_DIR, "features_scored.csv")
 PREMIUMS_CSV = os.path.join(DATA_DIR, "premiums.csv")
+SCORE_CACHE = os.path.join(DATA_DIR, "score_cache.joblib")
 MODEL_FILE = os.path.join(MODELS_DIR, "baseline_rf.joblib")
 
 # ---------- Helper ----------
@@ -71,7 +72,8 @@ try:
     run_script("risk_scoring_model.py", [
         "--input", FEATURES_CSV,
         "--model", MODEL_FILE,
-        "--out", SCORED_FEATURES_CSV
+        "--out", SCORED_FEATURES_CSV,
+        "--cache", SCORE_CACHE
     ])
 
     # 5. Compute premiums
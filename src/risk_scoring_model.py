@@ -7,17 +7,89 @@ Input:
 
 Output:
   - CSV with driver_id, features, and predicted risk_score
+
+Scores are cached on disk keyed by (model content hash, feature row hash), so
+a rescore after an incremental feature update only runs model.predict on new
+or changed rows. The cache is bounded and evicts least recently used entries.
 """
 import argparse
+import hashlib
+from collections import OrderedDict
 import pandas as pd
 import joblib
 import os
 
+
+def model_hash(model_path, feature_columns):
+    """
+    Hash the model file contents together with the feature column layout,
+    so cached scores are invalidated when either changes.
+    """
+    h = hashlib.sha256()
+    with open(model_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    h.update(",".join(feature_columns).encode("utf-8"))
+    return h.hexdigest()
+
+
+def load_cache(path):
+    """Load the score cache, or return an empty one if missing/unreadable."""
+    if path and os.path.exists(path):
+        try:
+            cache = joblib.load(path)
+            if isinstance(cache, OrderedDict):
+                return cache
+        except Exception as e:
+            print(f"Ignoring unreadable score cache {path}: {e}")
+    return OrderedDict()
+
+
+def save_cache(cache, path, max_entries):
+    """Evict least recently used entries down to max_entries and persist."""
+    while len(cache) > max_entries:
+        cache.popitem(last=False)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    joblib.dump(cache, path)
+
+
+def score_with_cache(model, X, model_key, cache):
+    """
+    Predict risk scores for X, reusing cached scores for unchanged rows.
+
+    Returns (scores, hits, misses). Newly predicted rows are added to the cache
+    and every touched entry is moved to the most recently used end.
+    """
+    row_hashes = pd.util.hash_pandas_object(X, index=False).to_numpy()
+    keys = [(model_key, int(rh)) for rh in row_hashes]
+
+    scores = pd.Series(index=X.index, dtype=float)
+    miss_pos = []
+    for pos, key in enumerate(keys):
+        if key in cache:
+            scores.iat[pos] = cache[key]
+            cache.move_to_end(key)
+        else:
+            miss_pos.append(pos)
+
+    if miss_pos:
+        preds = model.predict(X.iloc[miss_pos])
+        for pos, pred in zip(miss_pos, preds):
+            scores.iat[pos] = float(pred)
+            cache[keys[pos]] = float(pred)
+
+    hits = len(keys) - len(miss_pos)
+    return scores, hits, len(miss_pos)
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--input", required=True, help="Driver-level features CSV")
     parser.add_argument("--model", required=True, help="Trained risk model (.joblib)")
     parser.add_argument("--out", default="../data/features_scored.csv", help="Output CSV with risk scores")
+    parser.add_argument("--cache", default="../data/score_cache.joblib", help="Persistent score cache path")
+    parser.add_argument("--cache-size", type=int, default=100000, help="Max cached scores before LRU eviction")
+    parser.add_argument("--no-cache", action="store_true", help="Rescore every driver, bypassing the cache")
     args = parser.parse_args()
 
     # Load features
@@ -29,8 +101,15 @@ def main():
     # Prepare feature matrix (drop driver_id and risk_label if present)
     X = df.drop(columns=['driver_id', 'risk_label'], errors='ignore')
 
-    # Predict risk scores
-    df['risk_score'] = model.predict(X)
+    # Predict risk scores, reusing cached scores for unchanged feature rows
+    if args.no_cache:
+        df['risk_score'] = model.predict(X)
+    else:
+        cache = load_cache(args.cache)
+        model_key = model_hash(args.model, list(X.columns))
+        df['risk_score'], hits, misses = score_with_cache(model, X, model_key, cache)
+        save_cache(cache, args.cache, args.cache_size)
+        print(f"Score cache: {hits} hits, {misses} misses ({len(cache)} entries)")
 
     # Ensure output directory exists
     os.makedirs(os.path.dirname(args.out), exist_ok=True)